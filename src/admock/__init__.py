@@ -16,6 +16,7 @@ from .models import (
     StoryboardVersion,
     VideoOutput,
 )
+from .snapshot import SnapshotError, SnapshotReader, load_snapshot, write_snapshot
 from .workflow import AdMockStudioWorkflow
 
 __all__ = [
@@ -25,7 +26,11 @@ __all__ = [
     "Brief",
     "Frame",
     "Project",
+    "SnapshotError",
+    "SnapshotReader",
     "Storyboard",
     "StoryboardVersion",
     "VideoOutput",
+    "load_snapshot",
+    "write_snapshot",
 ]
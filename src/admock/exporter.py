@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Any, Iterable
 
 from .models import Project, Storyboard
+from .snapshot import write_snapshot
 
 
 class Exporter:
@@ -34,6 +35,9 @@ class Exporter:
             json.dump(self._to_serialisable(asdict(project)), handle, indent=2, ensure_ascii=False)
         return path
 
+    def export_project_snapshot(self, project: Project) -> Path:
+        return write_snapshot(project, self.base_path / f"{project.id}.admk")
+
     def bundle(self, project: Project, storyboards: Iterable[Storyboard]) -> list[Path]:
         paths = [self.export_project_json(project)]
         for storyboard in storyboards:
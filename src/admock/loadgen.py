@@ -0,0 +1,334 @@
+"""Concurrent-editing load generator for :class:`AdMockStudioWorkflow`.
+
+Simulated users replay a weighted mix of workflow operations against a pool
+of projects from separate threads. The run reports throughput, per-operation
+latency percentiles and any invariant violations found in the projects
+afterwards: duplicate version labels, storyboard ids that do not match their
+registration order, frame notes that disagree with the logged edits, hi-fi
+boards rendered from unlocked boards or capturing half of a global edit, and
+audit events that do not match the operations that succeeded.
+
+Run a local soak with::
+
+    PYTHONPATH=src python -m admock.loadgen --users 16 --projects 4 --operations 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .models import AudioProfile, Brief, Project, StoryboardStyle, StoryboardVersion
+from .workflow import AdMockStudioWorkflow
+
+DEFAULT_MIX: Dict[str, float] = {
+    "frame_edit": 0.45,
+    "global_edit": 0.2,
+    "lock": 0.1,
+    "render_hifi": 0.1,
+    "render_video": 0.1,
+    "create_concept": 0.05,
+}
+
+# Audit event logged by each operation when it succeeds.
+OPERATION_EVENTS: Dict[str, str] = {
+    "frame_edit": "FRAME_EDIT",
+    "global_edit": "GLOBAL_EDIT",
+    "lock": "STORYBOARD_LOCKED",
+    "render_hifi": "HIFI_RENDERED",
+    "render_video": "VIDEO_RENDERED",
+    "create_concept": "STORYBOARD_CREATED",
+}
+
+# Events written while preparing each project, before any user starts.
+SETUP_EVENTS = ("BRAND_EXTRACTED", "BRIEF_CAPTURED", "STORYBOARD_CREATED")
+
+
+@dataclass
+class OperationStats:
+    """Latency samples and outcome counts for one operation type."""
+
+    latencies: List[float] = field(default_factory=list)
+    succeeded: int = 0
+    rejected: int = 0
+    failed: int = 0
+
+    def percentile(self, pct: float) -> float:
+        """Nearest-rank percentile of the recorded latencies, in seconds."""
+
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+        return ordered[min(rank, len(ordered)) - 1]
+
+
+@dataclass
+class LoadReport:
+    """Aggregated outcome of a load run."""
+
+    elapsed: float
+    operations: Dict[str, OperationStats]
+    violations: List[str]
+    errors: List[str]
+
+    @property
+    def total_operations(self) -> int:
+        return sum(len(stats.latencies) for stats in self.operations.values())
+
+    @property
+    def throughput(self) -> float:
+        return self.total_operations / self.elapsed if self.elapsed else 0.0
+
+    def format(self) -> str:
+        lines = [
+            f"{self.total_operations} operations in {self.elapsed:.2f}s ({self.throughput:.0f} ops/s)",
+            f"{'operation':<16}{'ok':>7}{'rejected':>10}{'failed':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}",
+        ]
+        for name, stats in sorted(self.operations.items()):
+            lines.append(
+                f"{name:<16}{stats.succeeded:>7}{stats.rejected:>10}{stats.failed:>8}"
+                f"{stats.percentile(50) * 1000:>9.3f}{stats.percentile(95) * 1000:>9.3f}"
+                f"{stats.percentile(99) * 1000:>9.3f}"
+            )
+        lines.append(f"invariant violations: {len(self.violations)}")
+        lines.extend(f"  - {violation}" for violation in self.violations)
+        lines.extend(f"  ! {error}" for error in self.errors)
+        return "\n".join(lines)
+
+
+@dataclass
+class _UserResult:
+    samples: Dict[str, OperationStats] = field(default_factory=dict)
+    successes: Dict[str, Counter[str]] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+
+
+class LoadGenerator:
+    """Drive many workflows concurrently from simulated users.
+
+    Args:
+        users: Number of concurrent simulated editors (one thread each).
+        projects: Number of projects the users share.
+        operations_per_user: Operations each user performs.
+        mix: Relative weights per operation name, see :data:`DEFAULT_MIX`.
+        seed: Base seed so runs are reproducible per user.
+    """
+
+    def __init__(
+        self,
+        *,
+        users: int = 8,
+        projects: int = 4,
+        operations_per_user: int = 200,
+        mix: Optional[Dict[str, float]] = None,
+        seed: int = 0,
+    ) -> None:
+        if users < 1:
+            raise ValueError("users must be at least 1")
+        if projects < 1:
+            raise ValueError("projects must be at least 1")
+        if operations_per_user < 0:
+            raise ValueError("operations_per_user must not be negative")
+        self.users = users
+        self.operations_per_user = operations_per_user
+        self.mix = dict(mix or DEFAULT_MIX)
+        unknown = set(self.mix) - set(OPERATION_EVENTS)
+        if unknown:
+            raise ValueError(f"Unknown operations in mix: {sorted(unknown)}")
+        if any(weight < 0 for weight in self.mix.values()):
+            raise ValueError("Operation weights must not be negative")
+        if not any(weight > 0 for weight in self.mix.values()):
+            raise ValueError("At least one operation weight must be positive")
+        self.seed = seed
+        self.workflows = [self._prepare(f"load_{idx}") for idx in range(projects)]
+
+    def run(self) -> LoadReport:
+        results = [_UserResult() for _ in range(self.users)]
+        barrier = threading.Barrier(self.users + 1)
+        threads = [
+            threading.Thread(target=self._user, args=(idx, results[idx], barrier), name=f"loadgen-user-{idx}")
+            for idx in range(self.users)
+        ]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        started = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        operations: Dict[str, OperationStats] = {name: OperationStats() for name in self.mix}
+        successes: Dict[str, Counter[str]] = {workflow.project.id: Counter() for workflow in self.workflows}
+        errors: List[str] = []
+        for result in results:
+            for name, stats in result.samples.items():
+                merged = operations[name]
+                merged.latencies.extend(stats.latencies)
+                merged.succeeded += stats.succeeded
+                merged.rejected += stats.rejected
+                merged.failed += stats.failed
+            for project_id, counts in result.successes.items():
+                successes[project_id].update(counts)
+            errors.extend(result.errors)
+        violations: List[str] = []
+        for workflow in self.workflows:
+            violations.extend(check_invariants(workflow.project, successes[workflow.project.id]))
+        return LoadReport(elapsed=elapsed, operations=operations, violations=violations, errors=errors)
+
+    def _prepare(self, project_id: str) -> AdMockStudioWorkflow:
+        workflow = AdMockStudioWorkflow(Project(id=project_id, owner="loadgen"))
+        workflow.ingest_brand("Load Brand", f"https://{project_id}.example")
+        workflow.capture_brief(
+            Brief(
+                audience="Load testers",
+                objective="Awareness",
+                url=f"https://{project_id}.example",
+                ad_length_seconds=15,
+                platform="YouTube",
+                tone="neutral",
+            )
+        )
+        workflow.create_concept()
+        return workflow
+
+    def _user(self, idx: int, result: _UserResult, barrier: threading.Barrier) -> None:
+        barrier.wait()
+        try:
+            self._replay(idx, result)
+        except Exception as exc:  # noqa: BLE001 - a dead user must show up in the report
+            result.errors.append(f"user {idx} stopped: {exc!r}")
+
+    def _replay(self, idx: int, result: _UserResult) -> None:
+        rng = random.Random(self.seed * 1_000_003 + idx)
+        names = list(self.mix)
+        weights = [self.mix[name] for name in names]
+        for step in range(self.operations_per_user):
+            name = rng.choices(names, weights)[0]
+            workflow = rng.choice(self.workflows)
+            operation = self._operation(name, workflow, f"user {idx} step {step}", rng)
+            stats = result.samples.setdefault(name, OperationStats())
+            started = time.perf_counter()
+            try:
+                operation()
+            except ValueError:
+                # Domain rejections, e.g. rendering before the board is locked.
+                stats.rejected += 1
+            except Exception as exc:  # noqa: BLE001 - every crash is reported
+                stats.failed += 1
+                result.errors.append(f"{name} on {workflow.project.id}: {exc!r}")
+            else:
+                stats.succeeded += 1
+                result.successes.setdefault(workflow.project.id, Counter())[OPERATION_EVENTS[name]] += 1
+            stats.latencies.append(time.perf_counter() - started)
+
+    def _operation(
+        self, name: str, workflow: AdMockStudioWorkflow, label: str, rng: random.Random
+    ) -> Callable[[], object]:
+        if name == "frame_edit":
+            return lambda: workflow.apply_frame_edit(f"f{rng.randint(1, 5)}", f"Frame tweak by {label}")
+        if name == "global_edit":
+            return lambda: workflow.apply_global_edit(f"Global tweak by {label}")
+        if name == "lock":
+            return workflow.lock_storyboard
+        if name == "render_hifi":
+            return workflow.render_hifi_storyboard
+        if name == "render_video":
+            return lambda: workflow.render_video(AudioProfile(voice_style="neutral", music_style="ambient"))
+        return workflow.create_concept
+
+
+def check_invariants(project: Project, successes: Counter[str]) -> List[str]:
+    """Return human readable invariant violations for *project*.
+
+    *successes* counts the audit events the load run expects, keyed by event
+    name, excluding the events written during project setup.
+    """
+
+    violations: List[str] = []
+    labels = Counter(version.version for version in project.storyboards)
+    duplicates = sorted(label for label, count in labels.items() if count > 1)
+    if duplicates:
+        violations.append(f"{project.id}: duplicate version labels {duplicates}")
+
+    expected = Counter(SETUP_EVENTS) + successes
+    logged = Counter(entry["event"] for entry in project.audit_log)
+    for event in sorted(set(expected) | set(logged)):
+        if expected[event] != logged[event]:
+            violations.append(f"{project.id}: expected {expected[event]} {event} events, found {logged[event]}")
+
+    rendered = successes["VIDEO_RENDERED"]
+    if len(project.video_outputs) != rendered:
+        violations.append(f"{project.id}: expected {rendered} video outputs, found {len(project.video_outputs)}")
+
+    violations.extend(_check_storyboards(project))
+    return violations
+
+
+def _check_storyboards(project: Project) -> List[str]:
+    violations: List[str] = []
+    global_descriptions = {entry["description"] for entry in project.audit_log if entry["event"] == "GLOBAL_EDIT"}
+    pencils: Dict[str, StoryboardVersion] = {}
+    for position, version in enumerate(project.storyboards, start=1):
+        storyboard = version.storyboard
+        if storyboard.style == StoryboardStyle.PENCIL:
+            # Pencil ids are derived from the number of registered boards.
+            if storyboard.id != f"sb_{position}":
+                violations.append(f"{project.id}: pencil board at position {position} has id {storyboard.id}")
+            pencils.setdefault(storyboard.id, version)
+            continue
+        source = pencils.get(storyboard.id.removesuffix("-hifi"))
+        if source is None or not source.locked:
+            violations.append(f"{project.id}: {version.version} was not rendered from an earlier locked board")
+        # A global edit must reach every frame of a render or none of them.
+        global_notes = [set(frame.notes) & global_descriptions for frame in storyboard.frames]
+        if any(notes != global_notes[0] for notes in global_notes):
+            violations.append(f"{project.id}: {version.version} captured a global edit on some frames only")
+
+    edits: Counter[Tuple[str, str]] = Counter()
+    global_edits: Counter[str] = Counter()
+    for entry in project.audit_log:
+        if entry["event"] == "FRAME_EDIT":
+            edits[(entry["storyboard_id"], entry["frame_id"])] += 1
+        elif entry["event"] == "GLOBAL_EDIT":
+            global_edits[entry["storyboard_id"]] += 1
+    for storyboard_id, version in pencils.items():
+        for frame in version.storyboard.frames:
+            wanted = edits[(storyboard_id, frame.id)] + global_edits[storyboard_id]
+            if len(frame.notes) != wanted:
+                violations.append(
+                    f"{project.id}: {storyboard_id}/{frame.id} has {len(frame.notes)} notes, "
+                    f"audit log records {wanted} edits"
+                )
+    return violations
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=8)
+    parser.add_argument("--projects", type=int, default=4)
+    parser.add_argument("--operations", type=int, default=200, help="operations per user")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    try:
+        generator = LoadGenerator(
+            users=args.users,
+            projects=args.projects,
+            operations_per_user=args.operations,
+            seed=args.seed,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    report = generator.run()
+    print(report.format())
+    return 1 if report.violations or report.errors else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
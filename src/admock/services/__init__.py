@@ -1,15 +1,21 @@
 """Service layer exports for AdMock Studio."""
 
-from .brand_extractor import BrandExtractor, BrandExtractionResult
+from .brand_extractor import BrandExtractor, BrandExtractionResult, BrandRule, TTLCache
 from .storyboard_generator import HifiStoryboardGenerator, ShotList, StoryboardGenerator
+from .text_guidelines import CompiledGuidelines, GuidelineReport, TextGuidelineEngine
 from .video import VideoSynthesizer, VideoSynthesisResult
 
 __all__ = [
     "BrandExtractor",
     "BrandExtractionResult",
+    "BrandRule",
+    "TTLCache",
     "StoryboardGenerator",
     "ShotList",
     "HifiStoryboardGenerator",
+    "TextGuidelineEngine",
+    "CompiledGuidelines",
+    "GuidelineReport",
     "VideoSynthesizer",
     "VideoSynthesisResult",
 ]
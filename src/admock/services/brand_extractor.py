@@ -1,17 +1,44 @@
 """Brand token extraction service.
 
 The real product would crawl a website and extract design tokens. For the
-prototype we emulate the behaviour by transforming the supplied URL and
-heuristically inferring colour and typography choices.
+prototype we emulate the behaviour with keyword rules that are matched against
+the domain of the supplied URL and, when available, local HTML/CSS snapshots of the site.
+All rules are compiled into a single multi-pattern matcher, and results are
+cached per normalised domain so repeated projects for the same brand do not
+trigger another extraction.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict
+import copy
+import html
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Callable, Dict, Generic, Iterable, List, Optional, Pattern, Sequence, Tuple, TypeVar
+from urllib.parse import urlsplit
 
 from ..models import BrandTokens
 
+CATEGORY_PALETTE = "palette"
+CATEGORY_TYPOGRAPHY = "typography"
+CATEGORY_TONE = "tone"
+
+SNAPSHOT_SUFFIXES = (".html", ".htm", ".css")
+
+# Only human-facing copy and brand-chosen names are scanned; raw CSS syntax
+# (``text-decoration``, ``display``...) would otherwise trip the keyword rules.
+_HTML_HIDDEN = re.compile(r"<(script|style)\b.*?</\1\s*>|<!--.*?-->", re.IGNORECASE | re.DOTALL)
+_HTML_TAG = re.compile(r"<[^>]*>")
+_CSS_COMMENT = re.compile(r"/\*(.*?)\*/", re.DOTALL)
+_CSS_NAME = re.compile(r"(?:--|(?<![\w)])\.)([A-Za-z_][\w-]*)")
+
+V = TypeVar("V")
+
 
 @dataclass
 class BrandExtractionResult:
@@ -21,13 +48,154 @@ class BrandExtractionResult:
     warnings: list[str]
 
 
+@dataclass(frozen=True)
+class BrandRule:
+    """Maps any of *keywords* to a token value for one category."""
+
+    category: str
+    keywords: Tuple[str, ...]
+    value: Dict[str, str] | str
+
+
+DEFAULT_RULES: Tuple[BrandRule, ...] = (
+    BrandRule(
+        CATEGORY_PALETTE,
+        ("eco",),
+        {"primary": "#2E7D32", "secondary": "#1B5E20", "accent": "#A5D6A7"},
+    ),
+    BrandRule(
+        CATEGORY_PALETTE,
+        ("lux", "premium"),
+        {"primary": "#1A1A1A", "secondary": "#E5C07B", "accent": "#61AFEF"},
+    ),
+    BrandRule(
+        CATEGORY_TYPOGRAPHY,
+        ("eco",),
+        {"heading": "Work Sans SemiBold", "body": "Work Sans Regular"},
+    ),
+    BrandRule(
+        CATEGORY_TYPOGRAPHY,
+        ("lux", "premium"),
+        {"heading": "Playfair Display Bold", "body": "Source Sans Pro"},
+    ),
+    BrandRule(CATEGORY_TONE, ("play",), "confident, playful"),
+)
+
+
+class RuleMatcher:
+    """Single-pass matcher for a collection of :class:`BrandRule` objects.
+
+    Every keyword is folded into one alternation so a document is scanned once
+    regardless of how many rules are registered. By default matching is
+    substring based, mirroring the original ``keyword in url`` heuristics. With
+    *word_start* a keyword must begin a word, so ``luxury`` and
+    ``eco-friendly`` hit the ``lux`` and ``eco`` rules while ``deluxe`` and
+    ``decoration`` do not. In both modes matches may overlap, and a match also
+    counts for every shorter keyword it starts with, so ``lux`` is still hit
+    when a ``luxury`` keyword is registered too.
+    """
+
+    def __init__(self, rules: Sequence[BrandRule], *, word_start: bool = False) -> None:
+        self.rules = tuple(rules)
+        rules_by_keyword: Dict[str, List[int]] = {}
+        for index, rule in enumerate(self.rules):
+            for keyword in rule.keywords:
+                rules_by_keyword.setdefault(keyword.lower(), []).append(index)
+        keywords = sorted(rules_by_keyword, key=len, reverse=True)
+        self._rules_by_keyword: Dict[str, List[int]] = {
+            keyword: sorted(
+                {
+                    index
+                    for prefix, indices in rules_by_keyword.items()
+                    if keyword.startswith(prefix)
+                    for index in indices
+                }
+            )
+            for keyword in keywords
+        }
+        alternation = "|".join(re.escape(k) for k in keywords)
+        boundary = r"(?<!\w)" if word_start else ""
+        self._pattern: Optional[Pattern[str]] = (
+            re.compile(rf"{boundary}(?=({alternation}))", re.IGNORECASE) if keywords else None
+        )
+
+    def scan(self, text: str) -> Counter[int]:
+        """Return hit counts per rule index for *text*."""
+
+        hits: Counter[int] = Counter()
+        if self._pattern is None:
+            return hits
+        for match in self._pattern.finditer(text):
+            for index in self._rules_by_keyword[match.group(1).lower()]:
+                hits[index] += 1
+        return hits
+
+    def select(self, hits: Counter[int]) -> Dict[str, BrandRule]:
+        """Pick the earliest rule with any hit per category.
+
+        Rule order is the precedence, as with the original if/elif chain, so
+        ``eco`` beats ``lux`` whenever both appear.
+        """
+
+        selected: Dict[str, BrandRule] = {}
+        for index in sorted(index for index, count in hits.items() if count):
+            selected.setdefault(self.rules[index].category, self.rules[index])
+        return selected
+
+
+class TTLCache(Generic[V]):
+    """Thread-safe LRU cache whose entries expire after *ttl_seconds*."""
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: V) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
 class BrandExtractor:
     """High level interface for brand grounding.
 
-    The implementation does not perform network requests; instead it uses
-    simple heuristics to produce deterministic token packs suitable for unit
-    tests. This keeps the module self-contained while modelling the real
-    workflow's responsibilities.
+    The implementation does not perform network requests; instead it matches
+    keyword rules against the URL's domain (as substrings) and against the
+    visible copy, class names and custom properties of any local snapshot
+    files found under ``snapshot_root/<domain>/`` (at word starts) to produce deterministic token packs suitable for unit tests. The
+    URL path is ignored so that the result only depends on the domain it is
+    cached under. This keeps the module self-contained while modelling the
+    real workflow's responsibilities.
     """
 
     DEFAULT_COLORS: Dict[str, str] = {
@@ -39,6 +207,21 @@ class BrandExtractor:
         "heading": "Inter Bold",
         "body": "Inter Regular",
     }
+    DEFAULT_TONE = "modern, helpful"
+
+    def __init__(
+        self,
+        rules: Sequence[BrandRule] = DEFAULT_RULES,
+        *,
+        snapshot_root: Optional[str | Path] = None,
+        cache: Optional[TTLCache[BrandExtractionResult]] = None,
+        max_workers: int = 8,
+    ) -> None:
+        self.matcher = RuleMatcher(rules)
+        self.content_matcher = RuleMatcher(rules, word_start=True)
+        self.snapshot_root = Path(snapshot_root) if snapshot_root is not None else None
+        self.cache: TTLCache[BrandExtractionResult] = cache if cache is not None else TTLCache()
+        self.max_workers = max_workers
 
     def extract(self, brand: str, url: str) -> BrandExtractionResult:
         """Return a :class:`BrandTokens` instance derived from *url*.
@@ -48,11 +231,80 @@ class BrandExtractor:
             url: Website used for grounding.
         """
 
-        palette = self._infer_palette(url)
-        typography = self._infer_typography(url)
-        logo_url = f"{url.rstrip('/')}/assets/logo.svg"
+        domain = self.normalise_domain(url)
+        cached = self.cache.get(domain)
+        if cached is None:
+            cached = self._extract_uncached(brand, url, domain)
+            self.cache.set(domain, cached)
+        return self._for_brand(cached, brand, url)
+
+    def extract_many(self, brands: Iterable[Tuple[str, str]]) -> List[BrandExtractionResult]:
+        """Extract tokens for many ``(brand, url)`` pairs concurrently.
+
+        Results are returned in input order. Pairs sharing a domain are only
+        extracted once.
+        """
+
+        pairs = [(brand, url, self.normalise_domain(url)) for brand, url in brands]
+        resolved: Dict[str, BrandExtractionResult] = {}
+        pending: Dict[str, Tuple[str, str]] = {}
+        for brand, url, domain in pairs:
+            if domain in resolved or domain in pending:
+                continue
+            cached = self.cache.get(domain)
+            if cached is None:
+                pending[domain] = (brand, url)
+            else:
+                resolved[domain] = cached
+        if pending:
+            # Parallelism is across domains; each worker scans its snapshot
+            # files sequentially so the thread count stays at max_workers.
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = {
+                    domain: pool.submit(self._extract_uncached, brand, url, domain, parallel_scan=False)
+                    for domain, (brand, url) in pending.items()
+                }
+                for domain, future in futures.items():
+                    resolved[domain] = future.result()
+                    self.cache.set(domain, resolved[domain])
+        return [self._for_brand(resolved[domain], brand, url) for brand, url, domain in pairs]
+
+    @classmethod
+    def normalise_domain(cls, url: str) -> str:
+        """Return the cache key for *url*: its lower-cased host without ``www.``.
+
+        URLs that cannot be parsed are keyed by their stripped, lower-cased
+        text instead.
+        """
+
+        host = cls._parse_host(url)
+        if host is None:
+            return url.strip().lower()
+        if host.startswith("www."):
+            host = host[4:]
+        return host
+
+    @staticmethod
+    def _parse_host(url: str) -> Optional[str]:
+        try:
+            parts = urlsplit(url if "://" in url else f"//{url}")
+            return (parts.hostname or "").lower().rstrip(".")
+        except ValueError:
+            return None
+
+    def _extract_uncached(
+        self, brand: str, url: str, domain: str, *, parallel_scan: bool = True
+    ) -> BrandExtractionResult:
+        parsed = self._parse_host(url) is not None
+        hits = self.matcher.scan(domain)
+        if parsed:
+            hits.update(self._scan_snapshots(domain, parallel=parallel_scan))
+        selected = self.matcher.select(hits)
+        palette = self._rule_value(selected, CATEGORY_PALETTE, self.DEFAULT_COLORS)
+        typography = self._rule_value(selected, CATEGORY_TYPOGRAPHY, self.DEFAULT_TYPOGRAPHY)
+        tone_rule = selected.get(CATEGORY_TONE)
         voice = {
-            "tone": "confident, playful" if "play" in url else "modern, helpful",
+            "tone": tone_rule.value if tone_rule is not None else self.DEFAULT_TONE,
             "donts": ["no sarcasm", "no slang"],
         }
         tokens = BrandTokens(
@@ -60,26 +312,58 @@ class BrandExtractor:
             url=url,
             colors=palette,
             typography=typography,
-            logo={"url": logo_url, "safe_area": "10%"},
+            logo={"url": self._logo_url(url), "safe_area": "10%"},
             voice=voice,
         )
         warnings: list[str] = []
+        if not parsed:
+            warnings.append("Could not parse URL; matched rules against the raw text")
         if palette == self.DEFAULT_COLORS:
             warnings.append("Using default palette; no colours detected")
         if typography == self.DEFAULT_TYPOGRAPHY:
             warnings.append("Using default typography; no fonts detected")
         return BrandExtractionResult(tokens=tokens, warnings=warnings)
 
-    def _infer_palette(self, url: str) -> Dict[str, str]:
-        if "eco" in url:
-            return {"primary": "#2E7D32", "secondary": "#1B5E20", "accent": "#A5D6A7"}
-        if "lux" in url or "premium" in url:
-            return {"primary": "#1A1A1A", "secondary": "#E5C07B", "accent": "#61AFEF"}
-        return dict(self.DEFAULT_COLORS)
-
-    def _infer_typography(self, url: str) -> Dict[str, str]:
-        if "eco" in url:
-            return {"heading": "Work Sans SemiBold", "body": "Work Sans Regular"}
-        if "lux" in url or "premium" in url:
-            return {"heading": "Playfair Display Bold", "body": "Source Sans Pro"}
-        return dict(self.DEFAULT_TYPOGRAPHY)
+    def _scan_snapshots(self, domain: str, *, parallel: bool = True) -> Counter[int]:
+        hits: Counter[int] = Counter()
+        if self.snapshot_root is None or not domain:
+            return hits
+        site_dir = self.snapshot_root / domain
+        if not site_dir.is_dir():
+            return hits
+        paths = sorted(p for p in site_dir.rglob("*") if p.suffix.lower() in SNAPSHOT_SUFFIXES and p.is_file())
+        if not parallel or len(paths) < 2:
+            for path in paths:
+                hits.update(self._scan_file(path))
+            return hits
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for file_hits in pool.map(self._scan_file, paths):
+                hits.update(file_hits)
+        return hits
+
+    def _scan_file(self, path: Path) -> Counter[int]:
+        return self.content_matcher.scan(self._snapshot_text(path))
+
+    def _snapshot_text(self, path: Path) -> str:
+        source = path.read_text(encoding="utf-8", errors="ignore")
+        if path.suffix.lower() == ".css":
+            comments = _CSS_COMMENT.findall(source)
+            names = _CSS_NAME.findall(_CSS_COMMENT.sub(" ", source))
+            return "\n".join(comments + names)
+        return html.unescape(_HTML_TAG.sub(" ", _HTML_HIDDEN.sub(" ", source)))
+
+    def _rule_value(self, selected: Dict[str, BrandRule], category: str, default: Dict[str, str]) -> Dict[str, str]:
+        rule = selected.get(category)
+        if rule is None or not isinstance(rule.value, dict):
+            return dict(default)
+        return dict(rule.value)
+
+    def _for_brand(self, cached: BrandExtractionResult, brand: str, url: str) -> BrandExtractionResult:
+        # Hand out copies so callers mutating tokens cannot corrupt the cache.
+        tokens = copy.deepcopy(cached.tokens)
+        if tokens.brand != brand or tokens.url != url:
+            tokens = replace(tokens, brand=brand, url=url, logo={**tokens.logo, "url": self._logo_url(url)})
+        return BrandExtractionResult(tokens=tokens, warnings=list(cached.warnings))
+
+    def _logo_url(self, url: str) -> str:
+        return f"{url.rstrip('/')}/assets/logo.svg"
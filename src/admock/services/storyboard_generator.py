@@ -9,9 +9,10 @@ and hi-fi renders.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List
+from typing import Iterable, List, Optional, Tuple
 
 from ..models import BrandTokens, Frame, Storyboard, StoryboardStyle
+from .text_guidelines import GuidelineReport, TextGuidelineEngine
 
 
 @dataclass
@@ -80,14 +81,28 @@ class StoryboardGenerator:
 class HifiStoryboardGenerator:
     """Simulates the Nanobana adapter output."""
 
+    def __init__(self, guideline_engine: Optional[TextGuidelineEngine] = None) -> None:
+        self.guideline_engine = guideline_engine or TextGuidelineEngine()
+
     def render(self, storyboard: Storyboard, brand_tokens: BrandTokens) -> Storyboard:
+        storyboard, _ = self.render_with_report(storyboard, brand_tokens)
+        return storyboard
+
+    def render_with_report(
+        self, storyboard: Storyboard, brand_tokens: BrandTokens
+    ) -> Tuple[Storyboard, GuidelineReport]:
+        """Render *storyboard* and return the guideline hits for its text."""
+
+        report = self.guideline_engine.apply(
+            [frame.on_screen_text for frame in storyboard.frames], brand_tokens
+        )
         new_frames: List[Frame] = []
-        for frame in storyboard.frames:
+        for frame, on_screen_text in zip(storyboard.frames, report.texts):
             hifi_frame = Frame(
                 id=frame.id,
                 beat=frame.beat,
                 voice_over=frame.voice_over,
-                on_screen_text=self._apply_text_guidelines(frame.on_screen_text, brand_tokens),
+                on_screen_text=on_screen_text,
                 camera=frame.camera,
                 duration=frame.duration,
                 notes=list(frame.notes),
@@ -96,7 +111,7 @@ class HifiStoryboardGenerator:
                 music_cue=frame.music_cue or "brand_theme",
             )
             new_frames.append(hifi_frame)
-        return Storyboard(
+        hifi_storyboard = Storyboard(
             id=f"{storyboard.id}-hifi",
             style=StoryboardStyle.HIFI,
             frames=new_frames,
@@ -104,11 +119,4 @@ class HifiStoryboardGenerator:
             risks=storyboard.risks,
             alt_hooks=storyboard.alt_hooks,
         )
-
-    def _apply_text_guidelines(self, text: str, brand_tokens: BrandTokens) -> str:
-        max_words = 7
-        words = text.split()
-        if len(words) > max_words:
-            trimmed = " ".join(words[:max_words]) + "…"
-            return f"{trimmed} (trimmed to match {brand_tokens.brand} guidelines)"
-        return text
+        return hifi_storyboard, report
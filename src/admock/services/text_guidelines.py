@@ -0,0 +1,198 @@
+"""Brand text guideline engine for hi-fi rendering.
+
+Each brand's rule pack (word limits, banned phrases, casing and length rules)
+is compiled once and cached by a fingerprint of its :class:`BrandTokens`. The
+compiled pack is then applied to every on-screen text of a storyboard in a
+single batched pass, counting how often each rule fired.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Pattern, Sequence
+
+from ..models import BrandTokens
+
+RULE_BANNED_PHRASE = "banned_phrase"
+RULE_MAX_WORDS = "max_words"
+RULE_MAX_CHARACTERS = "max_characters"
+RULE_CASING = "casing"
+
+_DIRECTIVE_PREFIXES = ("no ", "avoid ", "never ", "don't ", "do not ")
+# Banned phrases are replaced by this marker first so the punctuation and
+# whitespace they leave behind can be tidied relative to where they were.
+_REMOVED = "\0"
+_HYPHEN_AT_REMOVAL = re.compile(rf"-?{_REMOVED}-?")
+_LEADING_REMOVAL = re.compile(rf"^(?:\s*{_REMOVED}[^\w\s{_REMOVED}]*)+\s*")
+_SPACE_BEFORE_PUNCT = re.compile(r"\s+([,.;:!?])")
+_REPEATED_SEPARATOR = re.compile(r"([,;:])(?:\s*[,;:])+")
+_EMPTY_BRACKETS = re.compile(r"\(\s*\)|\[\s*\]|\{\s*\}")
+_DANGLING_SEPARATOR = re.compile(r"\s*[,;:]\s*(?=[.!?)\]}]|$)")
+
+_CASINGS = {
+    "upper": str.upper,
+    "lower": str.lower,
+    "title": str.title,
+    "sentence": lambda text: text[:1].upper() + text[1:].lower(),
+}
+
+
+@dataclass
+class GuidelineReport:
+    """Outcome of applying a brand's guidelines to a batch of texts."""
+
+    texts: List[str]
+    hits: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class CompiledGuidelines:
+    """Rule pack for a single brand, ready to be applied to many texts."""
+
+    brand: str
+    max_words: Optional[int]
+    max_characters: Optional[int]
+    casing: Optional[str]
+    banned: Optional[Pattern[str]]
+
+    def apply(self, texts: Sequence[str]) -> GuidelineReport:
+        """Apply every rule to *texts* in one pass and count rule hits."""
+
+        hits: Counter[str] = Counter()
+        output: List[str] = []
+        for text in texts:
+            output.append(self._apply_one(text, hits))
+        return GuidelineReport(texts=output, hits=dict(hits))
+
+    def _apply_one(self, text: str, hits: Counter[str]) -> str:
+        trimmed = False
+        if self.banned is not None:
+            text, count = self.banned.subn(_REMOVED, text)
+            if count:
+                hits[RULE_BANNED_PHRASE] += count
+                text = _tidy_removals(text)
+        words = text.split()
+        if self.max_words is not None and len(words) > self.max_words:
+            words = words[: self.max_words]
+            hits[RULE_MAX_WORDS] += 1
+            trimmed = True
+        text = " ".join(words)
+        if self.max_characters is not None and len(text) > self.max_characters:
+            text = text[: self.max_characters].rstrip()
+            hits[RULE_MAX_CHARACTERS] += 1
+            trimmed = True
+        if self.casing is not None:
+            cased = _CASINGS[self.casing](text)
+            if cased != text:
+                hits[RULE_CASING] += 1
+                text = cased
+        if trimmed:
+            return f"{text}… (trimmed to match {self.brand} guidelines)"
+        return text
+
+
+def _tidy_removals(text: str) -> str:
+    text = _HYPHEN_AT_REMOVAL.sub(_REMOVED, text)
+    text = _LEADING_REMOVAL.sub("", text)
+    text = text.replace(_REMOVED, " ")
+    text = _EMPTY_BRACKETS.sub(" ", text)
+    text = _SPACE_BEFORE_PUNCT.sub(r"\1", text)
+    text = _REPEATED_SEPARATOR.sub(r"\1", text)
+    return _DANGLING_SEPARATOR.sub("", text.rstrip())
+
+
+class TextGuidelineEngine:
+    """Compile brand rule packs once and apply them in batches.
+
+    Rules are read from ``BrandTokens.voice``: ``donts`` supplies banned
+    phrases (directive prefixes such as "no " are stripped), while the optional
+    ``max_words``, ``max_characters`` and ``casing`` keys override the
+    defaults. Compiled packs are cached by a fingerprint of the tokens so a
+    brand is only compiled again when its tokens change. The cache is guarded
+    by a lock so one engine can be shared between threads.
+    """
+
+    DEFAULT_MAX_WORDS = 7
+
+    def __init__(self, max_cache_size: int = 256) -> None:
+        self.max_cache_size = max_cache_size
+        self._cache: "OrderedDict[str, CompiledGuidelines]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def compile(self, brand_tokens: BrandTokens) -> CompiledGuidelines:
+        """Return the cached rule pack for *brand_tokens*, compiling if needed."""
+
+        key = self.fingerprint(brand_tokens)
+        with self._lock:
+            compiled = self._cache.get(key)
+            if compiled is not None:
+                self._cache.move_to_end(key)
+                return compiled
+        compiled = self._compile(brand_tokens)
+        with self._lock:
+            self._cache[key] = compiled
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_cache_size:
+                self._cache.popitem(last=False)
+        return compiled
+
+    def apply(self, texts: Sequence[str], brand_tokens: BrandTokens) -> GuidelineReport:
+        return self.compile(brand_tokens).apply(texts)
+
+    @staticmethod
+    def fingerprint(brand_tokens: BrandTokens) -> str:
+        payload = json.dumps(asdict(brand_tokens), sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def _compile(self, brand_tokens: BrandTokens) -> CompiledGuidelines:
+        voice = brand_tokens.voice
+        casing = self._optional_str(voice.get("casing"))
+        if casing is not None and casing not in _CASINGS:
+            raise ValueError(f"Unsupported casing rule {casing!r}")
+        max_words = self._optional_limit(voice, "max_words")
+        return CompiledGuidelines(
+            brand=brand_tokens.brand,
+            max_words=self.DEFAULT_MAX_WORDS if max_words is None else max_words,
+            max_characters=self._optional_limit(voice, "max_characters"),
+            casing=casing,
+            banned=self._compile_banned(voice.get("donts", [])),
+        )
+
+    def _compile_banned(self, donts: List[str] | str) -> Optional[Pattern[str]]:
+        if isinstance(donts, str):
+            donts = [donts]
+        phrases = set()
+        for dont in donts:
+            phrase = dont.strip().lower()
+            for prefix in _DIRECTIVE_PREFIXES:
+                if phrase.startswith(prefix):
+                    phrase = phrase[len(prefix):].strip()
+                    break
+            if phrase:
+                phrases.add(phrase)
+        if not phrases:
+            return None
+        # Longest phrases first so overlapping entries match greedily. The
+        # lookarounds (rather than ``\b``) also work for phrases that start or
+        # end with punctuation, such as "#hashtags".
+        alternation = "|".join(re.escape(p) for p in sorted(phrases, key=len, reverse=True))
+        return re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE)
+
+    def _optional_limit(self, voice: Dict[str, List[str] | str], key: str) -> Optional[int]:
+        value = voice.get(key)
+        if value is None or isinstance(value, list):
+            return None
+        limit = int(value)
+        if limit < 1:
+            raise ValueError(f"Unsupported {key} rule {value!r}; must be at least 1")
+        return limit
+
+    def _optional_str(self, value: List[str] | str | None) -> Optional[str]:
+        if value is None or isinstance(value, list):
+            return None
+        return value.strip().lower()
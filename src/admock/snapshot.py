@@ -0,0 +1,334 @@
+"""Binary project snapshots.
+
+A snapshot is a versioned, sectioned container for a :class:`Project`. The
+file starts with a fixed header and a table of contents (TOC) listing each
+section's name, offset and length, so readers can jump straight to the brief,
+a single storyboard version or the tail of the audit log without decoding the
+rest of the file. Files can be read through ``mmap`` instead of being loaded
+into memory.
+
+Layout (all integers little-endian)::
+
+    header   magic "ADMK" | format version u16 | TOC length u32
+    TOC      entry count u32, then per entry: name length u16 | name | offset u64 | length u64
+    sections raw section payloads, addressed by the TOC offsets
+
+The audit log is split into chunks of :data:`AUDIT_CHUNK_SIZE` entries; the
+``audit_index`` section holds the entry count, the chunk size and the offset of
+each chunk within the ``audit_log`` section.
+
+Section payloads are compact UTF-8 JSON, so snapshots stay readable across
+Python versions and a malformed payload can only ever raise
+:class:`SnapshotError`. A full load costs about as much as parsing the
+``indent=2`` project export; the speed-up comes from decoding only the
+sections a caller asks for.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from contextlib import contextmanager
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .models import (
+    BrandTokens,
+    Brief,
+    Frame,
+    Project,
+    Storyboard,
+    StoryboardStyle,
+    StoryboardVersion,
+    VideoOutput,
+)
+
+MAGIC = b"ADMK"
+FORMAT_VERSION = 1
+
+SECTION_PROJECT = "project"
+SECTION_BRIEF = "brief"
+SECTION_AUDIT_INDEX = "audit_index"
+SECTION_AUDIT_LOG = "audit_log"
+STORYBOARD_PREFIX = "storyboard:"
+
+# Audit entries are stored in fixed-size chunks so a tail read only decodes
+# the last chunk or two instead of the whole log.
+AUDIT_CHUNK_SIZE = 256
+
+_HEADER = struct.Struct("<4sHI")
+_TOC_COUNT = struct.Struct("<I")
+_TOC_NAME = struct.Struct("<H")
+_TOC_RANGE = struct.Struct("<QQ")
+_AUDIT_INDEX_HEADER = struct.Struct("<II")
+_OFFSET = struct.Struct("<Q")
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot file is malformed or incompatible."""
+
+
+@contextmanager
+def _malformed(path: Path) -> Iterator[None]:
+    """Report low-level decoding failures as :class:`SnapshotError`."""
+
+    try:
+        yield
+    except SnapshotError:
+        raise
+    except (struct.error, EOFError, ValueError, TypeError, KeyError, IndexError) as exc:
+        raise SnapshotError(f"{path} is corrupt: {exc}") from exc
+
+
+def write_snapshot(project: Project, path: str | Path) -> Path:
+    """Serialise *project* to a binary snapshot at *path*.
+
+    Raises:
+        SnapshotError: If two storyboard versions share a label, since each
+            version is stored in a section named after it.
+    """
+
+    labels = [version.version for version in project.storyboards]
+    duplicates = sorted({label for label in labels if labels.count(label) > 1})
+    if duplicates:
+        raise SnapshotError(f"Duplicate storyboard version labels {duplicates}")
+
+    sections: List[Tuple[str, bytes]] = [
+        (
+            SECTION_PROJECT,
+            _encode(
+                {
+                    "id": project.id,
+                    "owner": project.owner,
+                    "brand_tokens": asdict(project.brand_tokens) if project.brand_tokens else None,
+                    "video_outputs": [asdict(output) for output in project.video_outputs],
+                    "storyboards": [version.version for version in project.storyboards],
+                }
+            ),
+        ),
+        (SECTION_BRIEF, _encode(asdict(project.brief) if project.brief else None)),
+    ]
+    for version in project.storyboards:
+        sections.append((STORYBOARD_PREFIX + version.version, _encode(_version_to_record(version))))
+
+    chunks = [
+        _encode(project.audit_log[start : start + AUDIT_CHUNK_SIZE])
+        for start in range(0, len(project.audit_log), AUDIT_CHUNK_SIZE)
+    ]
+    index = [_AUDIT_INDEX_HEADER.pack(len(project.audit_log), AUDIT_CHUNK_SIZE)]
+    position = 0
+    for chunk in chunks:
+        index.append(_OFFSET.pack(position))
+        position += len(chunk)
+    sections.append((SECTION_AUDIT_INDEX, b"".join(index)))
+    sections.append((SECTION_AUDIT_LOG, b"".join(chunks)))
+
+    names = [name.encode("utf-8") for name, _ in sections]
+    toc_length = _TOC_COUNT.size + sum(_TOC_NAME.size + len(name) + _TOC_RANGE.size for name in names)
+    offset = _HEADER.size + toc_length
+    toc = [_TOC_COUNT.pack(len(sections))]
+    for name, (_, payload) in zip(names, sections):
+        toc.append(_TOC_NAME.pack(len(name)) + name + _TOC_RANGE.pack(offset, len(payload)))
+        offset += len(payload)
+
+    path = Path(path)
+    with path.open("wb") as handle:
+        handle.write(_HEADER.pack(MAGIC, FORMAT_VERSION, toc_length))
+        handle.write(b"".join(toc))
+        for _, payload in sections:
+            handle.write(payload)
+    return path
+
+
+def load_snapshot(path: str | Path, *, use_mmap: bool = True) -> Project:
+    """Load a complete :class:`Project` from a snapshot file."""
+
+    with SnapshotReader(path, use_mmap=use_mmap) as reader:
+        return reader.load_project()
+
+
+class SnapshotReader:
+    """Random-access reader for binary project snapshots.
+
+    Only the header and TOC are read on open; section payloads are fetched on
+    demand, either from a memory map (the default) or via seek-and-read.
+    """
+
+    def __init__(self, path: str | Path, *, use_mmap: bool = True) -> None:
+        self.path = Path(path)
+        self._handle = self.path.open("rb")
+        self._map: Optional[mmap.mmap] = None
+        try:
+            self._size = os.fstat(self._handle.fileno()).st_size
+            if self._size < _HEADER.size:
+                raise SnapshotError(f"{self.path} is too short to be a snapshot")
+            if use_mmap:
+                self._map = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+            self.sections = self._read_toc()
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self) -> "SnapshotReader":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._handle.close()
+
+    @property
+    def storyboard_versions(self) -> List[str]:
+        return [name[len(STORYBOARD_PREFIX):] for name in self.sections if name.startswith(STORYBOARD_PREFIX)]
+
+    def read_brief(self) -> Optional[Brief]:
+        record = self._load_section(SECTION_BRIEF)
+        with _malformed(self.path):
+            return Brief(**record) if record is not None else None
+
+    def read_storyboard(self, version: str) -> StoryboardVersion:
+        name = STORYBOARD_PREFIX + version
+        if name not in self.sections:
+            raise KeyError(f"Storyboard version {version} not found")
+        record = self._load_section(name)
+        with _malformed(self.path):
+            return _version_from_record(record)
+
+    def read_audit_tail(self, count: int) -> List[Dict[str, str]]:
+        """Return the last *count* audit log entries."""
+
+        if count <= 0:
+            return []
+        with _malformed(self.path):
+            total, _ = _AUDIT_INDEX_HEADER.unpack_from(self._read_section(SECTION_AUDIT_INDEX))
+        return self._read_audit_from(max(total - count, 0))
+
+    def load_project(self) -> Project:
+        meta = self._load_section(SECTION_PROJECT)
+        with _malformed(self.path):
+            return Project(
+                id=meta["id"],
+                owner=meta["owner"],
+                brand_tokens=BrandTokens(**meta["brand_tokens"]) if meta["brand_tokens"] else None,
+                brief=self.read_brief(),
+                storyboards=[self.read_storyboard(version) for version in meta["storyboards"]],
+                video_outputs=[VideoOutput(**output) for output in meta["video_outputs"]],
+                audit_log=self._read_audit_from(0),
+            )
+
+    def _read_audit_from(self, first: int) -> List[Dict[str, str]]:
+        index = self._read_section(SECTION_AUDIT_INDEX)
+        log_length = self.sections[SECTION_AUDIT_LOG][1]
+        with _malformed(self.path):
+            total, chunk_size = _AUDIT_INDEX_HEADER.unpack_from(index, 0)
+            if first >= total:
+                return []
+            offsets = [offset for (offset,) in _OFFSET.iter_unpack(index[_AUDIT_INDEX_HEADER.size :])]
+            chunk = first // chunk_size
+            ends = offsets[chunk + 1 :] + [log_length]
+            if any(start > end for start, end in zip(offsets[chunk:], ends)) or ends[-1] > log_length:
+                raise SnapshotError(f"{self.path} has an inconsistent audit index")
+            base = offsets[chunk]
+            payload = memoryview(self._read_section(SECTION_AUDIT_LOG, base))
+            entries: List[Dict[str, str]] = []
+            for start, end in zip(offsets[chunk:], ends):
+                entries.extend(_decode(payload[start - base : end - base]))
+            return entries[first - chunk * chunk_size :]
+
+    def _read_toc(self) -> Dict[str, Tuple[int, int]]:
+        magic, format_version, toc_length = _HEADER.unpack(self._read(0, _HEADER.size))
+        if magic != MAGIC:
+            raise SnapshotError(f"{self.path} is not an AdMock snapshot")
+        if format_version != FORMAT_VERSION:
+            raise SnapshotError(f"Unsupported snapshot format version {format_version}")
+        data_start = _HEADER.size + toc_length
+        if data_start > self._size:
+            raise SnapshotError(f"{self.path} is truncated inside its table of contents")
+        toc = self._read(_HEADER.size, toc_length)
+        sections: Dict[str, Tuple[int, int]] = {}
+        with _malformed(self.path):
+            (count,) = _TOC_COUNT.unpack_from(toc, 0)
+            position = _TOC_COUNT.size
+            for _ in range(count):
+                (name_length,) = _TOC_NAME.unpack_from(toc, position)
+                position += _TOC_NAME.size
+                name = toc[position : position + name_length].decode("utf-8")
+                position += name_length
+                offset, length = _TOC_RANGE.unpack_from(toc, position)
+                position += _TOC_RANGE.size
+                if name in sections:
+                    raise SnapshotError(f"{self.path} has duplicate section {name!r}")
+                if offset < data_start or offset + length > self._size:
+                    raise SnapshotError(f"{self.path} is truncated inside section {name!r}")
+                sections[name] = (offset, length)
+        return sections
+
+    def _read_section(self, name: str, skip: int = 0) -> bytes:
+        try:
+            offset, length = self.sections[name]
+        except KeyError:
+            raise SnapshotError(f"Snapshot is missing section {name!r}") from None
+        if skip > length:
+            raise SnapshotError(f"{self.path} has an out-of-range offset in section {name!r}")
+        return self._read(offset + skip, length - skip)
+
+    def _load_section(self, name: str) -> Any:
+        payload = self._read_section(name)
+        with _malformed(self.path):
+            return _decode(payload)
+
+    def _read(self, offset: int, length: int) -> bytes:
+        if self._map is not None:
+            return self._map[offset : offset + length]
+        self._handle.seek(offset)
+        return self._handle.read(length)
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _decode(payload: bytes | memoryview) -> Any:
+    return json.loads(bytes(payload))
+
+
+def _version_to_record(version: StoryboardVersion) -> Dict[str, Any]:
+    storyboard = version.storyboard
+    return {
+        "version": version.version,
+        "locked": version.locked,
+        "created_at": version.created_at.isoformat(),
+        "storyboard": {
+            "id": storyboard.id,
+            "style": storyboard.style.value,
+            "frames": [asdict(frame) for frame in storyboard.frames],
+            "narrative": storyboard.narrative,
+            "risks": list(storyboard.risks),
+            "alt_hooks": list(storyboard.alt_hooks),
+        },
+    }
+
+
+def _version_from_record(record: Dict[str, Any]) -> StoryboardVersion:
+    storyboard = record["storyboard"]
+    return StoryboardVersion(
+        storyboard=Storyboard(
+            id=storyboard["id"],
+            style=StoryboardStyle(storyboard["style"]),
+            frames=[Frame(**frame) for frame in storyboard["frames"]],
+            narrative=storyboard["narrative"],
+            risks=storyboard["risks"],
+            alt_hooks=storyboard["alt_hooks"],
+        ),
+        version=record["version"],
+        locked=record["locked"],
+        created_at=datetime.fromisoformat(record["created_at"]),
+    )
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import functools
 import itertools
+import threading
 from dataclasses import dataclass
-from typing import Iterable, Optional
+from typing import Callable, Iterable, Optional, TypeVar
 
 from .exporter import Exporter
 from .models import (
@@ -20,8 +22,28 @@ from .models import (
 )
 from .services.brand_extractor import BrandExtractor, BrandExtractionResult
 from .services.storyboard_generator import HifiStoryboardGenerator, ShotList, StoryboardGenerator
+from .services.text_guidelines import TextGuidelineEngine
 from .services.video import VideoSynthesizer, VideoSynthesisResult
 
+F = TypeVar("F", bound=Callable[..., object])
+
+# Shared across workflows so a domain is extracted and each brand's guideline
+# pack is compiled once per process rather than once per project. Both are
+# thread-safe.
+DEFAULT_BRAND_EXTRACTOR = BrandExtractor()
+DEFAULT_GUIDELINE_ENGINE = TextGuidelineEngine()
+
+
+def _synchronized(method: F) -> F:
+    """Run *method* while holding the workflow's re-entrant lock."""
+
+    @functools.wraps(method)
+    def wrapper(self: "AdMockStudioWorkflow", *args: object, **kwargs: object) -> object:
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
 
 @dataclass
 class WorkflowState:
@@ -34,19 +56,32 @@ class WorkflowState:
 
 
 class AdMockStudioWorkflow:
-    """Coordinates the four-step workflow end-to-end."""
-
-    def __init__(self, project: Project) -> None:
+    """Coordinates the four-step workflow end-to-end.
+
+    Every public step holds a per-workflow re-entrant lock, so many editors
+    may drive the same project from different threads. The project must only
+    be mutated through its workflow for that guarantee to hold.
+    """
+
+    def __init__(
+        self,
+        project: Project,
+        *,
+        brand_extractor: Optional[BrandExtractor] = None,
+        guideline_engine: Optional[TextGuidelineEngine] = None,
+    ) -> None:
         self.project = project
-        self.brand_extractor = BrandExtractor()
+        self.brand_extractor = brand_extractor or DEFAULT_BRAND_EXTRACTOR
         self.storyboard_generator = StoryboardGenerator()
-        self.hifi_generator = HifiStoryboardGenerator()
+        self.hifi_generator = HifiStoryboardGenerator(guideline_engine or DEFAULT_GUIDELINE_ENGINE)
         self.video_synthesizer = VideoSynthesizer()
         self.exporter = Exporter()
         self._version_counter = itertools.count(1)
+        self._lock = threading.RLock()
         self.state = WorkflowState()
 
     # Step 1 -----------------------------------------------------------------
+    @_synchronized
     def ingest_brand(self, brand: str, url: str) -> BrandExtractionResult:
         result = self.brand_extractor.extract(brand, url)
         self.project.brand_tokens = result.tokens
@@ -54,10 +89,12 @@ class AdMockStudioWorkflow:
         self.state.brand_tokens = result.tokens
         return result
 
+    @_synchronized
     def capture_brief(self, brief: Brief) -> None:
         self.project.brief = brief
         self.project.log_event("BRIEF_CAPTURED", {"objective": brief.objective})
 
+    @_synchronized
     def create_concept(self) -> StoryboardVersion:
         if not self.project.brief:
             raise ValueError("Brief must be captured before generating concept")
@@ -73,16 +110,21 @@ class AdMockStudioWorkflow:
         return version
 
     # Step 2 -----------------------------------------------------------------
+    @_synchronized
     def apply_global_edit(self, description: str) -> None:
         storyboard = self._require_storyboard(StoryboardStyle.PENCIL)
         self.storyboard_generator.apply_global_edit(storyboard, description)
-        self.project.log_event("GLOBAL_EDIT", {"description": description})
+        self.project.log_event("GLOBAL_EDIT", {"storyboard_id": storyboard.id, "description": description})
 
+    @_synchronized
     def apply_frame_edit(self, frame_id: str, description: str) -> None:
         storyboard = self._require_storyboard(StoryboardStyle.PENCIL)
         self.storyboard_generator.apply_frame_edit(storyboard, frame_id, description)
-        self.project.log_event("FRAME_EDIT", {"frame_id": frame_id, "description": description})
+        self.project.log_event(
+            "FRAME_EDIT", {"storyboard_id": storyboard.id, "frame_id": frame_id, "description": description}
+        )
 
+    @_synchronized
     def lock_storyboard(self) -> StoryboardVersion:
         storyboard_version = self._require_storyboard_version(StoryboardStyle.PENCIL)
         storyboard_version.locked = True
@@ -91,19 +133,26 @@ class AdMockStudioWorkflow:
         return storyboard_version
 
     # Step 3 -----------------------------------------------------------------
+    @_synchronized
     def render_hifi_storyboard(self) -> StoryboardVersion:
         if not self.project.brand_tokens:
             raise ValueError("Brand tokens required before rendering hi-fi storyboard")
         pencil_version = self._require_storyboard_version(StoryboardStyle.PENCIL)
         if not pencil_version.locked:
             raise ValueError("Storyboard must be locked before hi-fi render")
-        hifi_storyboard = self.hifi_generator.render(pencil_version.storyboard, self.project.brand_tokens)
+        hifi_storyboard, report = self.hifi_generator.render_with_report(
+            pencil_version.storyboard, self.project.brand_tokens
+        )
         version = self._register_storyboard(hifi_storyboard)
         self.state.hifi_storyboard = hifi_storyboard
-        self.project.log_event("HIFI_RENDERED", {"storyboard_id": hifi_storyboard.id})
+        guideline_hits = ",".join(f"{rule}={count}" for rule, count in sorted(report.hits.items()))
+        self.project.log_event(
+            "HIFI_RENDERED", {"storyboard_id": hifi_storyboard.id, "guideline_hits": guideline_hits}
+        )
         return version
 
     # Step 4 -----------------------------------------------------------------
+    @_synchronized
     def render_video(self, audio: AudioProfile) -> VideoSynthesisResult:
         hifi_version = self._require_storyboard_version(StoryboardStyle.HIFI)
         result = self.video_synthesizer.render(hifi_version.storyboard, audio)
@@ -113,6 +162,7 @@ class AdMockStudioWorkflow:
         return result
 
     # Export -----------------------------------------------------------------
+    @_synchronized
     def export(self) -> list[str]:
         storyboards = [version.storyboard for version in self.project.storyboards]
         paths = self.exporter.bundle(self.project, storyboards)
@@ -137,14 +187,15 @@ class AdMockStudioWorkflow:
 
     def _increment_major_version(self, version: str) -> str:
         if "_locked" in version:
-            prefix, _, suffix = version.partition("_locked")
-            major = int(prefix.split("_v")[-1])
-            return f"sb_v{major + 1}_locked"
+            # Re-locking takes a fresh number; bumping the old one could collide
+            # with a label that was handed out since.
+            return f"sb_v{next(self._version_counter)}_locked"
         major = int(version.split("_v")[-1])
         return f"sb_v{major}_locked"
 
     def _next_storyboard_id(self) -> str:
         return f"sb_{len(self.project.storyboards) + 1}"
 
+    @_synchronized
     def get_state(self) -> WorkflowState:
         return self.state
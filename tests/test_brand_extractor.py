@@ -0,0 +1,165 @@
+"""Unit tests for the rule-driven brand extractor."""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from admock import AdMockStudioWorkflow, Project
+from admock.services import BrandExtractor, BrandRule, TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class BrandExtractorTestCase(unittest.TestCase):
+    def test_url_rules_match_original_heuristics(self) -> None:
+        extractor = BrandExtractor()
+        eco = extractor.extract("Eco Brand", "https://eco.example").tokens
+        self.assertEqual(eco.colors["primary"], "#2E7D32")
+        self.assertEqual(eco.typography["heading"], "Work Sans SemiBold")
+        lux = extractor.extract("Lux", "https://premium.example").tokens
+        self.assertEqual(lux.typography["heading"], "Playfair Display Bold")
+        plain = extractor.extract("Acme", "https://acme.example")
+        self.assertEqual(plain.tokens.voice["tone"], "modern, helpful")
+        self.assertEqual(len(plain.warnings), 2)
+
+    def test_snapshots_are_scanned_for_rule_keywords(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            site = Path(root) / "acme.example"
+            site.mkdir()
+            (site / "index.html").write_text("<h1>Premium luxury goods</h1>", encoding="utf-8")
+            (site / "styles.css").write_text("/* premium theme */ body { color: #000; }", encoding="utf-8")
+            result = BrandExtractor(snapshot_root=root).extract("Acme", "https://www.acme.example/shop")
+        self.assertEqual(result.tokens.colors["secondary"], "#E5C07B")
+        self.assertEqual(result.warnings, [])
+
+    def test_brand_copy_in_snapshots_matches_word_prefixes(self) -> None:
+        pages = {
+            "lux.example": '<p class="eco">Our luxury products</p><style>.x{display:block}</style>',
+            "green.example": "<p>Proudly eco-friendly</p>",
+            "plain.example": '<p style="text-decoration:none">Deluxe decoration</p>',
+        }
+        with tempfile.TemporaryDirectory() as root:
+            for domain, page in pages.items():
+                (Path(root) / domain).mkdir()
+                (Path(root) / domain / "index.html").write_text(page, encoding="utf-8")
+            extractor = BrandExtractor(snapshot_root=root)
+            lux = extractor.extract("Lux", "https://lux.example").tokens
+            green = extractor.extract("Green", "https://green.example").tokens
+            plain = extractor.extract("Plain", "https://plain.example").tokens
+        self.assertEqual(lux.colors["primary"], "#1A1A1A")
+        self.assertEqual(green.colors["primary"], "#2E7D32")
+        self.assertEqual(plain.colors, BrandExtractor.DEFAULT_COLORS)
+
+    def test_unparseable_url_falls_back_with_warning(self) -> None:
+        result = BrandExtractor().extract("B", "http://[bad")
+        self.assertEqual(result.tokens.colors, BrandExtractor.DEFAULT_COLORS)
+        self.assertIn("Could not parse URL; matched rules against the raw text", result.warnings)
+
+    def test_workflows_share_extraction_cache(self) -> None:
+        extractor = BrandExtractor()
+        calls = []
+        original = extractor._extract_uncached
+
+        def counting(*args, **kwargs):
+            calls.append(args[2])
+            return original(*args, **kwargs)
+
+        extractor._extract_uncached = counting  # type: ignore[method-assign]
+        for project_id in ("p1", "p2"):
+            workflow = AdMockStudioWorkflow(Project(id=project_id, owner="o"), brand_extractor=extractor)
+            workflow.ingest_brand("Eco", "https://eco.example")
+        self.assertEqual(calls, ["eco.example"])
+        first = AdMockStudioWorkflow(Project(id="d1", owner="o"))
+        second = AdMockStudioWorkflow(Project(id="d2", owner="o"))
+        self.assertIs(first.brand_extractor, second.brand_extractor)
+
+    def test_ordinary_stylesheet_falls_back_to_defaults(self) -> None:
+        stylesheet = """
+        a { text-decoration: none; display: block; }
+        .hero { display: flex; background: url(/img/deco.png); }
+        @media (prefers-reduced-motion) { * { animation-play-state: paused; } }
+        """
+        with tempfile.TemporaryDirectory() as root:
+            site = Path(root) / "acme.example"
+            site.mkdir()
+            (site / "site.css").write_text(stylesheet, encoding="utf-8")
+            (site / "index.html").write_text('<div class="hero" style="display:grid">Hi</div>', encoding="utf-8")
+            result = BrandExtractor(snapshot_root=root).extract("Acme", "https://acme.example")
+        self.assertEqual(result.tokens.colors, BrandExtractor.DEFAULT_COLORS)
+        self.assertEqual(result.tokens.voice["tone"], "modern, helpful")
+        self.assertEqual(len(result.warnings), 2)
+
+    def test_rule_order_sets_precedence(self) -> None:
+        extractor = BrandExtractor()
+        tokens = extractor.extract("Mixed", "https://luxpremium-eco.example").tokens
+        self.assertEqual(tokens.colors["primary"], "#2E7D32")
+        overlapping = BrandExtractor(
+            rules=(
+                BrandRule("palette", ("lux",), {"primary": "#111111"}),
+                BrandRule("palette", ("luxury",), {"primary": "#222222"}),
+            )
+        )
+        self.assertEqual(overlapping.extract("L", "https://luxury.example").tokens.colors["primary"], "#111111")
+
+    def test_url_path_is_ignored(self) -> None:
+        extractor = BrandExtractor()
+        first = extractor.extract("A", "https://acme.example/eco")
+        second = extractor.extract("A", "https://acme.example/lux")
+        self.assertEqual(first.tokens.colors, BrandExtractor.DEFAULT_COLORS)
+        self.assertEqual(second.tokens.colors, BrandExtractor.DEFAULT_COLORS)
+
+    def test_cache_is_keyed_by_domain_and_expires(self) -> None:
+        clock = FakeClock()
+        extractor = BrandExtractor(cache=TTLCache(max_size=2, ttl_seconds=60, clock=clock))
+        first = extractor.extract("Eco", "https://eco.example")
+        second = extractor.extract("Eco Two", "https://WWW.eco.example/about")
+        self.assertEqual(len(extractor.cache), 1)
+        self.assertEqual(second.tokens.brand, "Eco Two")
+        self.assertEqual(second.tokens.logo["url"], "https://WWW.eco.example/about/assets/logo.svg")
+        first.tokens.colors["primary"] = "#000000"
+        self.assertEqual(extractor.extract("Eco", "https://eco.example").tokens.colors["primary"], "#2E7D32")
+        clock.now = 61
+        self.assertIsNone(extractor.cache.get("eco.example"))
+
+    def test_extract_many_preserves_order(self) -> None:
+        extractor = BrandExtractor()
+        pairs = [(f"Brand {i}", f"https://{'eco' if i % 2 else 'lux'}{i}.example") for i in range(200)]
+        results = extractor.extract_many(pairs)
+        self.assertEqual([r.tokens.brand for r in results], [brand for brand, _ in pairs])
+        self.assertEqual(results[1].tokens.colors["primary"], "#2E7D32")
+        self.assertEqual(results[2].tokens.colors["primary"], "#1A1A1A")
+
+    def test_extract_many_does_not_refetch_evicted_domains(self) -> None:
+        extractor = BrandExtractor(cache=TTLCache(max_size=2))
+        calls = []
+        original = extractor._extract_uncached
+
+        def counting(*args, **kwargs):
+            calls.append(args[2])
+            return original(*args, **kwargs)
+
+        extractor._extract_uncached = counting  # type: ignore[method-assign]
+        pairs = [(f"B{i}", f"https://eco{i}.example") for i in range(10)]
+        results = extractor.extract_many(pairs + pairs[:1])
+        self.assertEqual(len(calls), 10)
+        self.assertEqual(results[-1].tokens.brand, "B0")
+
+    def tearDown(self) -> None:
+        if os.path.isdir("exports") and not os.listdir("exports"):
+            os.rmdir("exports")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
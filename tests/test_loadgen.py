@@ -0,0 +1,108 @@
+"""Soak test for concurrent workflow editing."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import sys
+import time
+import unittest
+from collections import Counter
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from admock.loadgen import LoadGenerator, OperationStats, check_invariants
+from admock.models import Frame
+
+_apply_edit = Frame.apply_edit
+
+
+def _yielding_apply_edit(self: Frame, description: str) -> None:
+    # Give up the GIL mid-edit, as a real edit doing I/O would, so unlocked
+    # interleavings show up within a short test run.
+    time.sleep(0)
+    _apply_edit(self, description)
+
+
+class LoadGeneratorTestCase(unittest.TestCase):
+    def test_concurrent_soak_has_no_violations(self) -> None:
+        generator = LoadGenerator(users=8, projects=2, operations_per_user=150, seed=7)
+        report = generator.run()
+        self.assertEqual(report.violations, [])
+        self.assertEqual(report.errors, [])
+        self.assertEqual(report.total_operations, 8 * 150)
+        self.assertGreater(report.throughput, 0)
+        self.assertIn("p99 ms", report.format())
+
+    def test_soak_detects_missing_workflow_lock(self) -> None:
+        with mock.patch.object(Frame, "apply_edit", _yielding_apply_edit):
+            locked = LoadGenerator(users=8, projects=1, operations_per_user=100, seed=3)
+            self.assertEqual(locked.run().violations, [])
+            unlocked = LoadGenerator(users=8, projects=1, operations_per_user=100, seed=3)
+            for workflow in unlocked.workflows:
+                workflow._lock = contextlib.nullcontext()  # type: ignore[assignment]
+            violations = unlocked.run().violations
+        self.assertTrue(any("global edit on some frames only" in violation for violation in violations))
+
+    def test_storyboard_invariants(self) -> None:
+        generator = LoadGenerator(users=1, projects=1, operations_per_user=0)
+        workflow = generator.workflows[0]
+        workflow.apply_global_edit("Brighter")
+        workflow.lock_storyboard()
+        workflow.render_hifi_storyboard()
+        project = workflow.project
+        successes = Counter({"GLOBAL_EDIT": 1, "STORYBOARD_LOCKED": 1, "HIFI_RENDERED": 1})
+        self.assertEqual(check_invariants(project, successes), [])
+        project.storyboards[0].storyboard.frames[0].notes.append("stray")
+        project.storyboards[0].locked = False
+        project.storyboards[1].storyboard.frames[1].notes.clear()
+        violations = check_invariants(project, successes)
+        self.assertEqual(len(violations), 3)
+        self.assertIn("not rendered from an earlier locked board", violations[0])
+        self.assertIn("captured a global edit on some frames only", violations[1])
+        self.assertIn("sb_1/f1 has 2 notes, audit log records 1 edits", violations[2])
+
+    def test_invariants_flag_duplicate_labels_and_missing_events(self) -> None:
+        generator = LoadGenerator(users=1, projects=1, operations_per_user=0)
+        project = generator.workflows[0].project
+        project.storyboards.append(project.storyboards[0])
+        violations = check_invariants(project, Counter({"FRAME_EDIT": 1}))
+        self.assertEqual(len(violations), 3)
+        self.assertIn("duplicate version labels ['sb_v1']", violations[0])
+        self.assertIn("expected 1 FRAME_EDIT events, found 0", violations[1])
+        self.assertIn("pencil board at position 2 has id sb_1", violations[2])
+
+    def test_percentile_uses_nearest_rank(self) -> None:
+        stats = OperationStats(latencies=[5.0, 1.0, 4.0, 2.0, 3.0])
+        self.assertEqual(stats.percentile(50), 3.0)
+        self.assertEqual(stats.percentile(95), 5.0)
+        self.assertEqual(stats.percentile(0), 1.0)
+
+    def test_rejects_empty_pools_and_reports_dead_users(self) -> None:
+        with self.assertRaises(ValueError):
+            LoadGenerator(users=0)
+        with self.assertRaises(ValueError):
+            LoadGenerator(projects=0)
+        with self.assertRaises(ValueError):
+            LoadGenerator(operations_per_user=-1)
+        with self.assertRaises(ValueError):
+            LoadGenerator(mix={"lock": 0.0})
+        with self.assertRaises(ValueError):
+            LoadGenerator(mix={"lock": 1.0, "frame_edit": -1.0})
+        generator = LoadGenerator(users=2, projects=1, operations_per_user=5)
+        # Losing the project pool mid-run makes every user fail before its
+        # first operation, outside the per-operation error handling.
+        generator.workflows.clear()
+        report = generator.run()
+        self.assertEqual(len(report.errors), 2)
+        self.assertIn("user 0 stopped", report.errors[0])
+
+    def tearDown(self) -> None:
+        if os.path.isdir("exports") and not os.listdir("exports"):
+            os.rmdir("exports")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
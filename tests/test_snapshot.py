@@ -0,0 +1,100 @@
+"""Unit tests for binary project snapshots."""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from admock import AdMockStudioWorkflow, AudioProfile, Brief, Project, SnapshotError, SnapshotReader, load_snapshot
+from admock.snapshot import write_snapshot
+
+
+class SnapshotTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.project = Project(id="proj_snap", owner="user_snap")
+        workflow = AdMockStudioWorkflow(self.project)
+        workflow.exporter.base_path = Path(self.tmp.name)
+        workflow.ingest_brand("Eco Brand", "https://eco.example")
+        workflow.capture_brief(
+            Brief(
+                audience="Eco conscious adults",
+                objective="Consideration",
+                url="https://eco.example",
+                ad_length_seconds=15,
+                platform="Instagram",
+                tone="optimistic",
+                languages=["en", "cs"],
+            )
+        )
+        workflow.create_concept()
+        workflow.apply_frame_edit("f2", "Add product close-up")
+        workflow.lock_storyboard()
+        workflow.render_hifi_storyboard()
+        workflow.render_video(AudioProfile(voice_style="neutral", music_style="ambient"))
+        self.path = workflow.exporter.export_project_snapshot(self.project)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+        if os.path.isdir("exports") and not os.listdir("exports"):
+            os.rmdir("exports")
+
+    def test_round_trip(self) -> None:
+        for use_mmap in (True, False):
+            self.assertEqual(load_snapshot(self.path, use_mmap=use_mmap), self.project)
+
+    def test_partial_reads(self) -> None:
+        with SnapshotReader(self.path) as reader:
+            self.assertEqual(reader.read_brief(), self.project.brief)
+            self.assertEqual(reader.storyboard_versions, ["sb_v1_locked", "sb_v2"])
+            hifi = reader.read_storyboard("sb_v2")
+            self.assertEqual(hifi, self.project.storyboards[1])
+            self.assertEqual(reader.read_audit_tail(2), self.project.audit_log[-2:])
+            self.assertEqual(reader.read_audit_tail(100), self.project.audit_log)
+            with self.assertRaises(KeyError):
+                reader.read_storyboard("sb_v9")
+
+    def test_audit_tail_spans_chunks(self) -> None:
+        for idx in range(600):
+            self.project.log_event("NOTE", {"idx": str(idx)})
+        path = write_snapshot(self.project, Path(self.tmp.name) / "long.admk")
+        with SnapshotReader(path, use_mmap=False) as reader:
+            tail = reader.read_audit_tail(300)
+        self.assertEqual(tail, self.project.audit_log[-300:])
+        self.assertEqual(load_snapshot(path).audit_log, self.project.audit_log)
+
+    def test_rejects_foreign_files(self) -> None:
+        bogus = Path(self.tmp.name) / "bogus.admk"
+        bogus.write_bytes(b"{}" * 16)
+        with self.assertRaises(SnapshotError):
+            load_snapshot(bogus)
+
+    def test_truncated_and_empty_files_raise_snapshot_error(self) -> None:
+        data = self.path.read_bytes()
+        for name, payload in (("empty", b""), ("toc", data[:20]), ("section", data[:-10])):
+            broken = Path(self.tmp.name) / f"{name}.admk"
+            broken.write_bytes(payload)
+            for use_mmap in (True, False):
+                with self.subTest(name=name, use_mmap=use_mmap), self.assertRaises(SnapshotError):
+                    load_snapshot(broken, use_mmap=use_mmap)
+
+    def test_duplicate_version_labels_are_rejected(self) -> None:
+        self.project.storyboards.append(self.project.storyboards[0])
+        with self.assertRaises(SnapshotError):
+            write_snapshot(self.project, Path(self.tmp.name) / "dup.admk")
+
+    def test_empty_project(self) -> None:
+        project = Project(id="empty", owner="nobody")
+        path = write_snapshot(project, Path(self.tmp.name) / "empty.admk")
+        self.assertEqual(load_snapshot(path), project)
+        with SnapshotReader(path) as reader:
+            self.assertEqual(reader.read_audit_tail(5), [])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
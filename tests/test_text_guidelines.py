@@ -0,0 +1,84 @@
+"""Unit tests for the brand text guideline engine."""
+
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from admock import BrandTokens
+from admock.services import TextGuidelineEngine
+
+
+def make_tokens(**voice: object) -> BrandTokens:
+    return BrandTokens(
+        brand="Acme",
+        url="https://acme.example",
+        colors={},
+        typography={},
+        logo={},
+        voice={"tone": "modern", "donts": ["no sarcasm", "no slang"], **voice},
+    )
+
+
+class TextGuidelineEngineTestCase(unittest.TestCase):
+    def test_rules_applied_in_batch_with_hit_counts(self) -> None:
+        engine = TextGuidelineEngine()
+        tokens = make_tokens(max_characters="24", casing="upper")
+        report = engine.apply(
+            [
+                "Short message",
+                "Pure sarcasm is not our style",
+                "One two three four five six seven eight nine",
+            ],
+            tokens,
+        )
+        self.assertEqual(report.texts[0], "SHORT MESSAGE")
+        self.assertEqual(report.texts[1], "PURE IS NOT OUR STYLE")
+        self.assertEqual(report.texts[2], "ONE TWO THREE FOUR FIVE… (trimmed to match Acme guidelines)")
+        self.assertEqual(
+            report.hits,
+            {"banned_phrase": 1, "max_words": 1, "max_characters": 1, "casing": 3},
+        )
+
+    def test_banned_phrase_removal_tidies_punctuation(self) -> None:
+        engine = TextGuidelineEngine()
+        tokens = make_tokens(donts=["no sarcasm", "no slang", "avoid #hashtags"])
+        report = engine.apply(
+            [
+                "Sarcasm, really?",
+                "slang-free zone",
+                "Shop now #hashtags!",
+                "Bold, sarcasm, style",
+                "Shop now, sarcasm.",
+                "Shop now, sarcasm",
+                "a (sarcasm) b",
+            ],
+            tokens,
+        )
+        self.assertEqual(
+            report.texts,
+            ["really?", "free zone", "Shop now!", "Bold, style", "Shop now.", "Shop now", "a b"],
+        )
+        self.assertEqual(report.hits, {"banned_phrase": 7})
+
+    def test_limits_below_one_are_rejected(self) -> None:
+        engine = TextGuidelineEngine()
+        for key in ("max_words", "max_characters"):
+            for value in ("0", "-1"):
+                with self.subTest(key=key, value=value), self.assertRaises(ValueError):
+                    engine.compile(make_tokens(**{key: value}))
+
+    def test_compiled_rules_cached_by_token_fingerprint(self) -> None:
+        engine = TextGuidelineEngine()
+        tokens = make_tokens()
+        self.assertIs(engine.compile(tokens), engine.compile(make_tokens()))
+        tokens.voice["max_words"] = "3"
+        self.assertIsNot(engine.compile(tokens), engine.compile(make_tokens()))
+        self.assertEqual(engine.compile(tokens).max_words, 3)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -56,6 +56,27 @@ class WorkflowTestCase(unittest.TestCase):
             payload = json.load(handle)
         self.assertEqual(payload["id"], "proj_test")
 
+    def test_hifi_render_logs_guideline_hits_and_shares_engine(self) -> None:
+        self.project.brand_tokens.voice["max_words"] = "1"
+        self.workflow.create_concept()
+        self.workflow.lock_storyboard()
+        self.workflow.render_hifi_storyboard()
+        event = self.project.audit_log[-1]
+        self.assertEqual(event["event"], "HIFI_RENDERED")
+        self.assertEqual(event["guideline_hits"], "max_words=5")
+        other = AdMockStudioWorkflow(Project(id="proj_other", owner="user_test"))
+        self.assertIs(other.hifi_generator.guideline_engine, self.workflow.hifi_generator.guideline_engine)
+
+    def test_relocking_never_reuses_version_labels(self) -> None:
+        self.workflow.create_concept()
+        for _ in range(3):
+            self.workflow.lock_storyboard()
+        self.workflow.render_hifi_storyboard()
+        self.workflow.create_concept()
+        self.workflow.lock_storyboard()
+        labels = [version.version for version in self.project.storyboards]
+        self.assertEqual(len(labels), len(set(labels)))
+
     def tearDown(self) -> None:
         if os.path.isdir("exports"):
             for name in os.listdir("exports"):